@@ -8,11 +8,33 @@ import os
 import csv
 import sys
 import argparse
-import statistics
+import hashlib
+import json
+import multiprocessing
+import queue
+import sqlite3
+import threading
+import urllib.parse
 from pathlib import Path
+from bisect import bisect_right
 from collections import Counter
-from PyPDF2 import PdfReader
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import logging
+import numpy as np
+
+# Numba compiles the statistics kernel; without it the kernel runs as plain Python
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+# PDFium (C++) text extraction is much faster than pure-Python PyPDF2
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+    from PyPDF2 import PdfReader
 
 # Enhanced requirements for this approach
 try:
@@ -25,133 +47,473 @@ except ImportError:
 # Silence warnings
 logging.basicConfig(level=logging.ERROR)
 
+# Joins documents into one LanguageTool request; matches on it are discarded
+DOC_SEPARATOR = "\n\n@@@DOCBREAK@@@\n\n"
+
+# Upper bound on the joined length of one batched request; longer texts are checked alone
+MAX_BATCH_CHARS = 40_000
+
+# Documents checked together in one LanguageTool call in single-process mode
+DOC_BATCH_SIZE = 16
+
+# Lowercase fragments of LanguageTool category names that denote spelling errors
+SPELLING_CATEGORY_KEYWORDS = frozenset({'typo', 'morfologik', 'spell'})
+
+# On-disk cache of evaluation results, one file per language
+RESULT_CACHE_PATH = ".lt_cache_{language}.db"
+
+# Large PDFs are split into chunks of this many pages for the page pool
+PARALLEL_PAGE_THRESHOLD = 50
+PARALLEL_PAGE_CHUNK = 25
+
+# Output CSV columns
+CSV_HEADERS = [
+    'Relative Directory', 'Filename', 'Pages', 'Word Count', 'Words/Page', 'Characters',
+    'Total Errors', 'Errors per 100 Words', 'Spelling Errors', 'Grammar Errors',
+    'Error Categories', 'Valid Words', 'Valid Word %', 'Most Common Error',
+    'Quality Score', 'Quality Rating'
+]
+
+# Large output buffer to cut write() calls; flushed every CSV_FLUSH_ROWS rows so progress is visible
+CSV_BUFFER_SIZE = 1 << 20
+CSV_FLUSH_ROWS = 1024
+
+# Texts with fewer words, or a smaller share of letters, are rated without a LanguageTool check
+MIN_WORDS = 5
+MIN_LETTER_RATIO = 0.3
+
+# Every value of the 'Quality Rating' column, in report order
+QUALITY_RATINGS = ["Excellent", "Good", "Fair", "Poor", "Very Poor", "No Text", "Error"]
+QUALITY_RATING_CODES = {rating: code for code, rating in enumerate(QUALITY_RATINGS)}
+
+# Byte lookup table for the ASCII whitespace that str.split() breaks words on
+_WHITESPACE_BYTES = np.zeros(256, dtype=bool)
+_WHITESPACE_BYTES[list(b' \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f')] = True
+
+# The ASCII characters for which str.isalpha() is true
+_ASCII_LETTERS = b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'
+
+def count_words(text):
+    """Count whitespace-separated words without building a list of them"""
+    if not text:
+        return 0
+    
+    # The byte table only knows ASCII whitespace; str.split() also breaks on NBSP, em space etc.
+    if not text.isascii():
+        return len(text.split())
+    
+    is_space = _WHITESPACE_BYTES[np.frombuffer(text.encode('ascii'), dtype=np.uint8)]
+    # A word starts at a non-space byte that is first or follows a space
+    word_starts = is_space[:-1] & ~is_space[1:]
+    return int(not is_space[0]) + int(np.count_nonzero(word_starts))
+
+def open_result_cache(language):
+    """Open (creating if needed) the evaluation result cache for a language"""
+    # SQLite locking lets several worker processes share the same cache file
+    connection = sqlite3.connect(RESULT_CACHE_PATH.format(language=language), timeout=30)
+    try:
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, result TEXT NOT NULL)"
+        )
+    except sqlite3.Error:
+        connection.close()
+        raise
+    return connection
+
+def group_by_length(texts, indices, max_chars=MAX_BATCH_CHARS):
+    """Split indices into runs whose joined texts stay under max_chars (a longer text gets its own run)"""
+    group = []
+    size = 0
+    
+    for i in indices:
+        length = len(texts[i]) + len(DOC_SEPARATOR)
+        if group and size + length > max_chars:
+            yield group
+            group = []
+            size = 0
+        group.append(i)
+        size += length
+    
+    if group:
+        yield group
+
 class LanguageQualityEvaluator:
     """LanguageTool-based grammar and spelling evaluation"""
     
-    def __init__(self, language='en-US'):
+    def __init__(self, language='en-US', use_cache=True, remote_server=None, quiet=False):
+        self.language = language
+        
+        # Category name -> is spelling, filled in as new categories are seen
+        self._spelling_categories = {}
+        
+        # An unusable cache (read-only directory, corrupt file) only disables caching
+        self.cache = None
+        if use_cache:
+            try:
+                self.cache = open_result_cache(language)
+            except sqlite3.Error as e:
+                print(f"Warning: Could not open result cache, continuing without it: {e}")
+        
         try:
-            print("Initializing LanguageTool (this may take a moment)...")
-            self.tool = language_tool_python.LanguageTool(language)
-            print("LanguageTool ready!")
+            if not quiet:
+                print("Initializing LanguageTool (this may take a moment)...")
+            # With remote_server, connect to a running server instead of starting a JVM
+            self.tool = language_tool_python.LanguageTool(language, remote_server=remote_server)
+            if not quiet:
+                print("LanguageTool ready!")
         except Exception as e:
             print(f"Error initializing LanguageTool: {e}")
             print("This might be due to Java not being installed or network issues.")
             raise
     
-    def evaluate_text(self, text):
+    @property
+    def server_url(self):
+        """Base URL of the LanguageTool HTTP server used by this evaluator"""
+        # The tool's url is the API endpoint (".../v2/"); strip it back to the server root
+        return urllib.parse.urljoin(self.tool.url, '/')
+    
+    def evaluate_text(self, text, word_count=None):
         """Evaluate text quality using LanguageTool"""
-        if not text.strip():
-            return {
-                'total_errors': 0,
-                'errors_per_100_words': 0,
-                'spelling_errors': 0,
-                'grammar_errors': 0,
-                'word_count': 0,
-                'error_types': {},
-                'valid_words': 0,
-                'valid_word_percentage': 0
-            }
+        if word_count is None:
+            word_count = count_words(text)
+        
+        if word_count == 0:
+            return self.empty_result()
+        
+        cache_key = self.cache_key(text)
+        cached = self.cache_get(cache_key)
+        if cached is not None:
+            return cached
         
         try:
             # Get errors from LanguageTool
             matches = self.tool.check(text)
+            result = self.summarize_matches(text, matches, word_count)
+            self.cache_put(cache_key, result)
+            return result
             
-            # Count words
-            words = text.split()
-            word_count = len(words)
-            
-            # Count valid words (words not flagged by LanguageTool)
-            flagged_positions = set()
-            for match in matches:
-                # Get the position range of the error
-                start_pos = match.offset
-                end_pos = match.offset + match.errorLength
-                flagged_positions.add((start_pos, end_pos))
-            
-            # Calculate valid words (approximate - words not in error regions)
-            valid_words = self.estimate_valid_words(text, flagged_positions, word_count)
-            valid_word_percentage = (valid_words / word_count * 100) if word_count > 0 else 0
-            
-            # Categorize errors
-            spelling_errors = 0
-            grammar_errors = 0
-            error_types = Counter()
+        except Exception as e:
+            print(f"Warning: LanguageTool evaluation failed: {e}")
+            return self.failed_result(word_count)
+    
+    def evaluate_texts(self, texts, word_counts=None):
+        """Evaluate several texts, joining short ones into shared LanguageTool checks"""
+        if word_counts is None:
+            word_counts = [count_words(text) for text in texts]
+        
+        results = [None] * len(texts)
+        cache_keys = [None] * len(texts)
+        pending = []
+        
+        for i, text in enumerate(texts):
+            if word_counts[i] == 0:
+                results[i] = self.empty_result()
+                continue
             
-            for match in matches:
-                category = match.category
-                error_types[category] += 1
-                
-                # Classify error type (spelling vs grammar)
-                if any(keyword in category.upper() for keyword in ['TYPO', 'MORFOLOGIK', 'SPELL']):
-                    spelling_errors += 1
-                else:
-                    grammar_errors += 1
+            # Only texts missing from the cache go to LanguageTool
+            cache_keys[i] = self.cache_key(text)
+            results[i] = self.cache_get(cache_keys[i])
+            if results[i] is None:
+                pending.append(i)
+        
+        # Requests are capped in size so a few long documents cannot hit the LanguageTool timeout
+        for group in group_by_length(texts, pending):
+            self.check_group(texts, word_counts, group, cache_keys, results)
+        
+        return results
+    
+    def check_group(self, texts, word_counts, group, cache_keys, results):
+        """Check the texts at the indices in group with one LanguageTool call, filling results"""
+        # Start offset of each document inside the joined text
+        offsets = []
+        position = 0
+        for i in group:
+            offsets.append(position)
+            position += len(texts[i]) + len(DOC_SEPARATOR)
+        
+        try:
+            matches = self.tool.check(DOC_SEPARATOR.join(texts[i] for i in group))
+        except Exception as e:
+            print(f"Warning: Batched LanguageTool check failed, checking documents one by one: {e}")
+            for i in group:
+                results[i] = self.evaluate_text(texts[i], word_counts[i])
+            return
+        
+        # Hand each match back to the document it came from
+        doc_matches = [[] for _ in group]
+        for match in matches:
+            doc = bisect_right(offsets, match.offset) - 1
+            local_offset = match.offset - offsets[doc]
             
-            # Calculate errors per 100 words
-            errors_per_100 = (len(matches) / word_count * 100) if word_count > 0 else 0
+            # Matches on the separator itself belong to no document
+            if local_offset >= len(texts[group[doc]]):
+                continue
             
-            return {
-                'total_errors': len(matches),
-                'errors_per_100_words': errors_per_100,
-                'spelling_errors': spelling_errors,
-                'grammar_errors': grammar_errors,
-                'word_count': word_count,
-                'error_types': dict(error_types),
-                'valid_words': valid_words,
-                'valid_word_percentage': valid_word_percentage
-            }
+            match.offset = local_offset
+            doc_matches[doc].append(match)
+        
+        # A document whose matches cannot be summarized fails alone, as in evaluate_text
+        for doc, i in enumerate(group):
+            try:
+                results[i] = self.summarize_matches(texts[i], doc_matches[doc], word_counts[i])
+            except Exception as e:
+                print(f"Warning: LanguageTool evaluation failed: {e}")
+                results[i] = self.failed_result(word_counts[i])
+                continue
+            self.cache_put(cache_keys[i], results[i])
+    
+    def summarize_matches(self, text, matches, word_count):
+        """Build quality metrics for one text (of word_count words) from its LanguageTool matches"""
+        # Calculate valid words (approximate - words not in error regions)
+        valid_words = self.estimate_valid_words(len(matches), word_count)
+        valid_word_percentage = (valid_words / word_count * 100) if word_count > 0 else 0
+        
+        # Categorize errors
+        spelling_errors = 0
+        grammar_errors = 0
+        error_types = Counter()
+        
+        for match in matches:
+            category = match.category
+            error_types[category] += 1
             
-        except Exception as e:
-            print(f"Warning: LanguageTool evaluation failed: {e}")
-            word_count = len(text.split())
-            return {
-                'total_errors': 0,
-                'errors_per_100_words': 0,
-                'spelling_errors': 0,
-                'grammar_errors': 0,
-                'word_count': word_count,
-                'error_types': {},
-                'valid_words': word_count,  # Assume all valid if check failed
-                'valid_word_percentage': 100
-            }
-    
-    def estimate_valid_words(self, text, flagged_positions, total_words):
-        """Estimate number of valid words based on error positions"""
-        if not flagged_positions:
+            # Classify error type (spelling vs grammar)
+            if self.is_spelling_category(category):
+                spelling_errors += 1
+            else:
+                grammar_errors += 1
+        
+        # Calculate errors per 100 words
+        errors_per_100 = (len(matches) / word_count * 100) if word_count > 0 else 0
+        
+        return {
+            'total_errors': len(matches),
+            'errors_per_100_words': errors_per_100,
+            'spelling_errors': spelling_errors,
+            'grammar_errors': grammar_errors,
+            'word_count': word_count,
+            'error_types': error_types,
+            'valid_words': valid_words,
+            'valid_word_percentage': valid_word_percentage
+        }
+    
+    def cache_key(self, text):
+        """Cache key for a text, or None when caching is disabled"""
+        if self.cache is None:
+            return None
+        return hashlib.blake2b(
+            text.encode('utf-8'), digest_size=16, key=self.language.encode('utf-8')
+        ).hexdigest()
+    
+    def cache_get(self, key):
+        """Return the cached result for a key, or None if there is none"""
+        if key is None:
+            return None
+        try:
+            row = self.cache.execute("SELECT result FROM results WHERE key = ?", (key,)).fetchone()
+        except sqlite3.Error:
+            return None
+        if not row:
+            return None
+        
+        # An entry that does not decode to a full result is a miss, so the text is checked again
+        try:
+            result = json.loads(row[0])
+            if self.empty_result().keys() - result.keys():
+                return None
+            result['error_types'] = Counter(result['error_types'])
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return None
+        return result
+    
+    def cache_put(self, key, result):
+        """Store a result in the cache (best effort)"""
+        if key is None:
+            return
+        try:
+            with self.cache:
+                self.cache.execute(
+                    "INSERT OR REPLACE INTO results (key, result) VALUES (?, ?)",
+                    (key, json.dumps(result))
+                )
+        except sqlite3.Error:
+            # A busy or read-only cache must not stop the evaluation
+            pass
+    
+    def is_spelling_category(self, category):
+        """Check whether a LanguageTool category counts as a spelling error"""
+        is_spelling = self._spelling_categories.get(category)
+        if is_spelling is None:
+            category_lower = category.lower()
+            is_spelling = any(keyword in category_lower for keyword in SPELLING_CATEGORY_KEYWORDS)
+            self._spelling_categories[category] = is_spelling
+        return is_spelling
+    
+    def failed_result(self, word_count):
+        """Metrics for a text whose LanguageTool evaluation failed"""
+        return {
+            'total_errors': 0,
+            'errors_per_100_words': 0,
+            'spelling_errors': 0,
+            'grammar_errors': 0,
+            'word_count': word_count,
+            'error_types': Counter(),
+            'valid_words': word_count,  # Assume all valid if check failed
+            'valid_word_percentage': 100
+        }
+    
+    def empty_result(self):
+        """Metrics for a text with no content"""
+        return {
+            'total_errors': 0,
+            'errors_per_100_words': 0,
+            'spelling_errors': 0,
+            'grammar_errors': 0,
+            'word_count': 0,
+            'error_types': Counter(),
+            'valid_words': 0,
+            'valid_word_percentage': 0
+        }
+    
+    def estimate_valid_words(self, num_matches, total_words):
+        """Estimate number of valid words based on the number of errors"""
+        if not num_matches:
             return total_words
         
         # A single spelling error affects one word, while a grammar error might span two or more; 1.5 is a balanced average
-        estimated_affected_words = len(flagged_positions) * 1.5
+        estimated_affected_words = num_matches * 1.5
         valid_words = max(0, total_words - estimated_affected_words)
         
         return int(valid_words)
     
     def __del__(self):
-        """Clean up LanguageTool"""
+        """Clean up LanguageTool and the result cache"""
         if hasattr(self, 'tool'):
             try:
                 self.tool.close()
             except:
                 pass
+        if getattr(self, 'cache', None) is not None:
+            try:
+                self.cache.close()
+            except:
+                pass
 
-def extract_pdf_text(file_path):
+def extract_pdf_text(file_path, page_pool=None):
     """Extract text from PDF file"""
+    if pdfium is not None:
+        return extract_pdf_text_pdfium(file_path, page_pool)
+    return extract_pdf_text_pypdf2(file_path)
+
+def _page_texts(pdf, start, stop):
+    """Text of pages [start, stop) of an open pypdfium2 document"""
+    parts = []
+    
+    for i in range(start, stop):
+        page = pdf[i]
+        textpage = page.get_textpage()
+        parts.append(textpage.get_text_bounded())
+        textpage.close()
+        page.close()
+    
+    return parts
+
+def _extract_page_range(file_path, start, stop):
+    """Open a PDF and extract the text of pages [start, stop) (page pool task)"""
+    pdf = pdfium.PdfDocument(file_path)
+    try:
+        return _page_texts(pdf, start, stop)
+    finally:
+        pdf.close()
+
+def extract_pdf_text_pdfium(file_path, page_pool=None):
+    """Extract text from PDF file using pypdfium2"""
     try:
-        reader = PdfReader(file_path)
-        text = ""
-        page_count = len(reader.pages)
+        pdf = pdfium.PdfDocument(file_path)
+        try:
+            page_count = len(pdf)
+            
+            # PDFium is not thread-safe, so large PDFs are split across processes instead
+            if page_pool is not None and page_count > PARALLEL_PAGE_THRESHOLD:
+                futures = [
+                    page_pool.submit(_extract_page_range, file_path, start,
+                                     min(start + PARALLEL_PAGE_CHUNK, page_count))
+                    for start in range(0, page_count, PARALLEL_PAGE_CHUNK)
+                ]
+                parts = [text for future in futures for text in future.result()]
+            else:
+                parts = _page_texts(pdf, 0, page_count)
+        finally:
+            pdf.close()
         
-        for page in reader.pages:
-            page_text = page.extract_text() or ""
-            text += page_text + "\n"
+        return "\n".join(parts).strip(), page_count
+    except Exception as e:
+        print(f"Warning: Could not extract text from {file_path}: {e}")
+        return "", 0
+
+def extract_pdf_text_pypdf2(file_path):
+    """Extract text from PDF file using PyPDF2 (fallback)"""
+    try:
+        # Read from our own file object so the descriptor is released as soon as we are done
+        with open(file_path, 'rb') as pdf_file:
+            reader = PdfReader(pdf_file)
+            page_count = len(reader.pages)
+            parts = []
+            
+            for page in reader.pages:
+                parts.append(page.extract_text() or "")
         
-        return text.strip(), page_count
+        return "\n".join(parts).strip(), page_count
     except Exception as e:
         print(f"Warning: Could not extract text from {file_path}: {e}")
         return "", 0
 
-def evaluate_pdf_quality(file_path, lang_evaluator, root_dir=None):
+def count_letters(text):
+    """Count the characters of text for which str.isalpha() is true"""
+    if text.isascii():
+        data = text.encode('ascii')
+        return len(data) - len(data.translate(None, _ASCII_LETTERS))
+    return sum(map(str.isalpha, text))
+
+def prefilter_text(text, word_count, min_words=MIN_WORDS, min_letter_ratio=MIN_LETTER_RATIO):
+    """Return synthetic 'very poor' metrics for text too short or noisy to check, else None"""
+    if word_count >= min_words:
+        if count_letters(text) / len(text) >= min_letter_ratio:
+            return None
+    
+    # Treat every word as an error so the document scores as "Very Poor"
+    return {
+        'total_errors': word_count,
+        'errors_per_100_words': 100 if word_count > 0 else 0,
+        'spelling_errors': 0,
+        'grammar_errors': 0,
+        'word_count': word_count,
+        'error_types': Counter({'LOW_TEXT_CONTENT': word_count}),
+        'valid_words': 0,
+        'valid_word_percentage': 0
+    }
+
+def evaluate_pdf_quality(file_path, lang_evaluator, root_dir=None, min_words=MIN_WORDS, min_letter_ratio=MIN_LETTER_RATIO):
     """Evaluate PDF quality using LanguageTool"""
+    try:
+        # Extract text from PDF
+        text, page_count = extract_pdf_text(file_path)
+        
+        # LanguageTool evaluation, skipped for empty or garbage text
+        word_count = count_words(text)
+        lang_results = None
+        if word_count:
+            lang_results = prefilter_text(text, word_count, min_words, min_letter_ratio)
+            if lang_results is None:
+                lang_results = lang_evaluator.evaluate_text(text, word_count)
+        
+        return build_result_row(file_path, text, page_count, lang_results, root_dir)
+        
+    except Exception as e:
+        return build_error_row(file_path, e, root_dir)
+
+def split_result_path(file_path, root_dir=None):
+    """Split a PDF path into the (relative directory, filename) CSV columns"""
     file_dir, filename = os.path.split(file_path)
     
     # Handle relative directory calculation
@@ -160,24 +522,32 @@ def evaluate_pdf_quality(file_path, lang_evaluator, root_dir=None):
     else:
         relative_dir = file_dir
     
+    return relative_dir, filename
+
+def build_error_row(file_path, error, root_dir=None):
+    """Build the CSV row for a PDF that could not be evaluated"""
+    relative_dir, filename = split_result_path(file_path, root_dir)
+    return [
+        relative_dir, filename, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, str(error)[:30], 0, "Error"
+    ]
+
+def build_result_row(file_path, text, page_count, lang_results, root_dir=None):
+    """Build the CSV row for a PDF from its extracted text and LanguageTool results"""
+    relative_dir, filename = split_result_path(file_path, root_dir)
+    
     try:
-        # Extract text from PDF
-        text, page_count = extract_pdf_text(file_path)
-        
-        if not text.strip():
+        if lang_results is None or lang_results['word_count'] == 0:
             return [
                 relative_dir, filename, page_count, 0, 0, "No text extracted",
                 0, 0, 0, 0, 0, 0, 0, "None", 0, "No Text"
             ]
         
         # Basic text metrics
-        word_count = len(text.split())
+        word_count = lang_results['word_count']
         char_count = len(text)
         words_per_page = word_count / page_count if page_count > 0 else 0
         
-        # LanguageTool evaluation
-        lang_results = lang_evaluator.evaluate_text(text)
-        
         # Calculate quality score
         quality_score = calculate_quality_score(lang_results)
         quality_rating = classify_quality(quality_score, lang_results['errors_per_100_words'])
@@ -205,10 +575,60 @@ def evaluate_pdf_quality(file_path, lang_evaluator, root_dir=None):
         ]
         
     except Exception as e:
-        return [
-            relative_dir, filename, 0, 0, 0, 0,
-            0, 0, 0, 0, 0, 0, 0, str(e)[:30], 0, "Error"
-        ]
+        return build_error_row(file_path, e, root_dir)
+
+def extract_into_queue(pdf_files, out_queue, page_pool=None, quiet=False):
+    """Producer: put (file_path, text, page_count) for each PDF on a queue, then None"""
+    try:
+        for i, pdf_file in enumerate(pdf_files):
+            if not quiet:
+                print(f"Extracting {i+1}/{len(pdf_files)}: {Path(pdf_file).name}")
+            
+            text, page_count = extract_pdf_text(pdf_file, page_pool)
+            out_queue.put((pdf_file, text, page_count))
+    finally:
+        out_queue.put(None)
+
+def evaluate_extracted_batch(batch, lang_evaluator, root_dir=None, min_words=MIN_WORDS, min_letter_ratio=MIN_LETTER_RATIO):
+    """Build result rows for a batch of (file_path, text, page_count) with one LanguageTool check"""
+    # Like evaluate_pdf_quality, a failing document becomes an Error row without stopping the batch
+    rows = [None] * len(batch)
+    all_lang_results = [None] * len(batch)
+    to_check = []
+    
+    for i, (file_path, text, _) in enumerate(batch):
+        try:
+            word_count = count_words(text)
+            
+            # Empty or garbage texts never reach LanguageTool (a zero count makes evaluate_texts skip them)
+            if word_count:
+                all_lang_results[i] = prefilter_text(text, word_count, min_words, min_letter_ratio)
+            if all_lang_results[i] is None:
+                to_check.append((i, word_count))
+        except Exception as e:
+            rows[i] = build_error_row(file_path, e, root_dir)
+    
+    try:
+        checked = lang_evaluator.evaluate_texts(
+            [batch[i][1] for i, _ in to_check], [word_count for _, word_count in to_check]
+        )
+    except Exception:
+        # Retry one document at a time so only the failing ones become Error rows
+        checked = []
+        for i, word_count in to_check:
+            try:
+                checked.append(lang_evaluator.evaluate_text(batch[i][1], word_count))
+            except Exception as e:
+                rows[i] = build_error_row(batch[i][0], e, root_dir)
+                checked.append(None)
+    
+    for (i, _), lang_results in zip(to_check, checked):
+        all_lang_results[i] = lang_results
+    
+    return [
+        row if row is not None else build_result_row(file_path, text, page_count, lang_results, root_dir)
+        for row, (file_path, text, page_count), lang_results in zip(rows, batch, all_lang_results)
+    ]
 
 def calculate_quality_score(lang_results):
     """Calculate overall quality score (0-100) based on language metrics"""
@@ -263,7 +683,25 @@ def get_most_common_error_type(error_types):
     """Get most common error type"""
     if not error_types:
         return "None"
-    return max(error_types, key=error_types.get)
+    return error_types.most_common(1)[0][0]
+
+def _walk_pdf_files(root):
+    """Yield paths of PDF files under root using os.scandir (cached stat, no Path objects)"""
+    stack = [root]
+    
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.lower().endswith('.pdf'):
+                    yield entry.path
 
 def find_pdf_files(input_path):
     """Find PDF files from input path (file or directory)"""
@@ -282,8 +720,7 @@ def find_pdf_files(input_path):
             raise ValueError(f"Input file is not a PDF: {input_path}")
     
     elif input_path.is_dir():
-        for pdf_file in input_path.rglob('*.pdf'):
-            pdf_files.append(str(pdf_file))
+        pdf_files.extend(_walk_pdf_files(str(input_path)))
         return pdf_files, input_path
     
     else:
@@ -325,6 +762,51 @@ OCR Comparison Workflow:
         help='LanguageTool language code (default: en-US)'
     )
     
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Number of worker processes sharing one LanguageTool server (default: CPU count; 1 disables multiprocessing)'
+    )
+    
+    parser.add_argument(
+        '--remote-server',
+        help='URL of a running LanguageTool server to use instead of starting one (e.g. http://localhost:8081)'
+    )
+    
+    parser.add_argument(
+        '--page-workers',
+        type=int,
+        default=min(4, os.cpu_count() or 1),
+        help=f'Processes used to extract the pages of PDFs over {PARALLEL_PAGE_THRESHOLD} pages when --workers is 1 (default: up to 4)'
+    )
+    
+    parser.add_argument(
+        '--min-words',
+        type=int,
+        default=MIN_WORDS,
+        help=f'Texts with fewer words are rated Very Poor without a LanguageTool check (default: {MIN_WORDS})'
+    )
+    
+    parser.add_argument(
+        '--min-letter-ratio',
+        type=float,
+        default=MIN_LETTER_RATIO,
+        help=f'Texts whose share of letters is below this are rated Very Poor without a LanguageTool check (default: {MIN_LETTER_RATIO})'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Do not read or write the on-disk result cache (.lt_cache_<language>.db)'
+    )
+    
+    parser.add_argument(
+        '--sort',
+        action='store_true',
+        help='Sort the output CSV by quality score (best first) once all PDFs are done'
+    )
+    
     parser.add_argument(
         '--quiet',
         action='store_true',
@@ -339,35 +821,108 @@ OCR Comparison Workflow:
     
     return parser.parse_args()
 
-def print_statistics(results, quiet=False):
+@njit(cache=True)
+def compute_stats(score, err100, valid_pct, rating, n_ratings):
+    """Single pass over the result columns; NaN marks values left out of a mean"""
+    score_sum = 0.0
+    score_n = 0
+    err_sum = 0.0
+    err_n = 0
+    valid_sum = 0.0
+    valid_n = 0
+    best_idx = -1
+    worst_idx = -1
+    hist = np.zeros(n_ratings, dtype=np.int64)
+    
+    for i in range(score.shape[0]):
+        hist[rating[i]] += 1
+        
+        if not np.isnan(score[i]):
+            score_sum += score[i]
+            score_n += 1
+            if best_idx < 0 or score[i] > score[best_idx]:
+                best_idx = i
+            if worst_idx < 0 or score[i] < score[worst_idx]:
+                worst_idx = i
+        
+        if not np.isnan(err100[i]):
+            err_sum += err100[i]
+            err_n += 1
+        
+        if not np.isnan(valid_pct[i]):
+            valid_sum += valid_pct[i]
+            valid_n += 1
+    
+    mean_score = score_sum / score_n if score_n > 0 else 0.0
+    mean_err = err_sum / err_n if err_n > 0 else 0.0
+    mean_valid = valid_sum / valid_n if valid_n > 0 else 0.0
+    
+    return mean_score, mean_err, mean_valid, best_idx, worst_idx, hist
+
+class ResultStatistics:
+    """Columnar store of the numeric result fields, filled row by row"""
+    
+    def __init__(self, capacity):
+        self.size = 0
+        self.filenames = []
+        self.columns = {
+            'score': np.empty(capacity, dtype=np.float64),
+            'err100': np.empty(capacity, dtype=np.float64),
+            'valid_pct': np.empty(capacity, dtype=np.float64),
+            'rating': np.empty(capacity, dtype=np.int8),
+        }
+    
+    def update(self, row):
+        """Add one CSV result row"""
+        i = self.size
+        self.size += 1
+        self.filenames.append(row[1])
+        
+        columns = self.columns
+        columns['rating'][i] = QUALITY_RATING_CODES[row[15]]
+        columns['score'][i] = np.nan
+        columns['err100'][i] = np.nan
+        columns['valid_pct'][i] = np.nan
+        
+        if row[15] == "Error" or row[15] == "No Text":
+            return
+        
+        columns['score'][i] = float(row[14])
+        
+        if row[7] != "0":
+            columns['err100'][i] = float(row[7])
+        
+        if row[12] != "0%":
+            columns['valid_pct'][i] = float(row[12].replace('%', ''))
+    
+    def compute(self):
+        """Return (mean_score, mean_err, mean_valid, best_idx, worst_idx, hist)"""
+        n = self.size
+        columns = self.columns
+        return compute_stats(
+            columns['score'][:n], columns['err100'][:n], columns['valid_pct'][:n],
+            columns['rating'][:n], len(QUALITY_RATINGS)
+        )
+
+def print_statistics(stats, quiet=False):
     """Print comprehensive statistics"""
     if quiet:
         return
     
-    valid_results = [r for r in results if r[15] != "Error" and r[15] != "No Text"]
+    avg_quality, avg_error_rate, avg_valid_words, best_idx, worst_idx, hist = stats.compute()
+    
+    # Calculate statistics
+    total_docs = stats.size
+    valid_docs = total_docs - hist[QUALITY_RATING_CODES["No Text"]] - hist[QUALITY_RATING_CODES["Error"]]
     
-    if not valid_results:
+    if not valid_docs:
         print("\nNo valid results for analysis.")
         return
     
-    # Calculate statistics
-    total_docs = len(results)
-    valid_docs = len(valid_results)
-    
     # Quality distribution
-    quality_counts = Counter(r[15] for r in results)
-    
-    # Error statistics
-    error_rates = [float(r[7]) for r in valid_results if r[7] != "0"]
-    avg_error_rate = statistics.mean(error_rates) if error_rates else 0
+    quality_counts = Counter({rating: int(count) for rating, count in zip(QUALITY_RATINGS, hist) if count})
     
-    # Quality scores
-    quality_scores = [float(r[14]) for r in valid_results]
-    avg_quality = statistics.mean(quality_scores) if quality_scores else 0
-    
-    # Valid word percentages
-    valid_word_pcts = [float(r[12].replace('%', '')) for r in valid_results if r[12] != "0%"]
-    avg_valid_words = statistics.mean(valid_word_pcts) if valid_word_pcts else 0
+    score = stats.columns['score']
     
     print(f"\n{'='*60}")
     print("OCR QUALITY EVALUATION REPORT (LanguageTool)")
@@ -385,17 +940,47 @@ def print_statistics(results, quiet=False):
     print(f"  Valid words: {avg_valid_words:.1f}%")
     
     # Best and worst documents
-    if quality_scores:
-        best_doc = max(valid_results, key=lambda x: float(x[14]))
-        worst_doc = min(valid_results, key=lambda x: float(x[14]))
-        
-        print(f"\nBest Document: {best_doc[1]} (Score: {best_doc[14]})")
-        print(f"Worst Document: {worst_doc[1]} (Score: {worst_doc[14]})")
+    if best_idx >= 0:
+        print(f"\nBest Document: {stats.filenames[best_idx]} (Score: {score[best_idx]:.1f})")
+        print(f"Worst Document: {stats.filenames[worst_idx]} (Score: {score[worst_idx]:.1f})")
         
     print(f"\n💡 Lower 'Errors per 100 Words' = Better OCR")
     print(f"💡 Higher 'Quality Score' = Better OCR")
     print(f"💡 Higher 'Valid Word %' = Better OCR")
 
+def sort_results_file(path):
+    """Rewrite a results CSV sorted by quality score (best first)"""
+    with open(path, newline='', encoding='utf-8') as csvfile:
+        reader = csv.reader(csvfile)
+        headers = next(reader)
+        results = list(reader)
+    
+    # Parse each score once, then let NumPy order the rows (stable, best first)
+    keys = np.fromiter(
+        (0.0 if r[14] == "0" else float(r[14]) for r in results),
+        dtype=np.float64, count=len(results)
+    )
+    order = np.argsort(-keys, kind='stable')
+    
+    with open(path, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(headers)
+        writer.writerows(results[i] for i in order)
+
+# Per-process LanguageTool evaluator, created by _worker_init in each pool worker
+_LT = None
+
+def _worker_init(language, use_cache, remote_server):
+    """Create this worker's LanguageTool client for the shared server"""
+    global _LT
+    # The main process already reported on LanguageTool; workers stay silent
+    _LT = LanguageQualityEvaluator(language, use_cache, remote_server, quiet=True)
+
+def _worker_eval(args):
+    """Evaluate a single (file_path, root_dir, min_words, min_letter_ratio) task inside a pool worker"""
+    file_path, root_dir, min_words, min_letter_ratio = args
+    return evaluate_pdf_quality(file_path, _LT, root_dir, min_words, min_letter_ratio)
+
 def main():
     args = parse_arguments()
     
@@ -411,37 +996,94 @@ def main():
             input_type = "file" if len(pdf_files) == 1 else "directory"
             print(f"Found {len(pdf_files)} PDF file(s) to evaluate from {input_type}")
         
-        # Initialize LanguageTool
-        lang_evaluator = LanguageQualityEvaluator(args.language)
+        stats = ResultStatistics(len(pdf_files))
+        workers = max(1, min(args.workers, len(pdf_files)))
         
-        # Process PDFs (single-threaded to avoid LanguageTool conflicts)
-        results = []
-        
-        for i, pdf_file in enumerate(pdf_files):
-            if not args.quiet:
-                print(f"Processing {i+1}/{len(pdf_files)}: {Path(pdf_file).name}")
-            
-            result = evaluate_pdf_quality(pdf_file, lang_evaluator, root_dir)
-            results.append(result)
-        
-        # Write results
-        headers = [
-            'Relative Directory', 'Filename', 'Pages', 'Word Count', 'Words/Page', 'Characters',
-            'Total Errors', 'Errors per 100 Words', 'Spelling Errors', 'Grammar Errors',
-            'Error Categories', 'Valid Words', 'Valid Word %', 'Most Common Error',
-            'Quality Score', 'Quality Rating'
-        ]
-        
-        with open(args.output, 'w', newline='', encoding='utf-8') as csvfile:
+        # Rows are written as soon as each PDF is done
+        with open(args.output, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as csvfile:
             writer = csv.writer(csvfile)
-            writer.writerow(headers)
+            writer.writerow(CSV_HEADERS)
             
+            if workers == 1:
+                # Single process: a producer thread extracts ahead while the main thread
+                # checks batches of documents in one LanguageTool call each
+                lang_evaluator = LanguageQualityEvaluator(args.language, not args.no_cache, args.remote_server,
+                                                          quiet=args.quiet)
+                
+                # With no outer pool, the pages of large PDFs are extracted in parallel.
+                # Workers start lazily from the producer thread, so they are spawned rather
+                # than forked from a process holding threads, the JVM client and the cache
+                page_pool = None
+                if pdfium is not None and args.page_workers > 1:
+                    page_pool = ProcessPoolExecutor(max_workers=args.page_workers,
+                                                    mp_context=multiprocessing.get_context('spawn'))
+                
+                # Bounded so that at most one batch of extracted text waits in memory
+                extracted_queue = queue.Queue(maxsize=DOC_BATCH_SIZE)
+                producer = threading.Thread(
+                    target=extract_into_queue,
+                    args=(pdf_files, extracted_queue, page_pool, args.quiet),
+                    daemon=True
+                )
+                producer.start()
+                
+                try:
+                    done = False
+                    while not done:
+                        batch = []
+                        while len(batch) < DOC_BATCH_SIZE:
+                            item = extracted_queue.get()
+                            if item is None:
+                                done = True
+                                break
+                            batch.append(item)
+                        
+                        if not batch:
+                            break
+                        
+                        if not args.quiet:
+                            print(f"Checking {len(batch)} document(s) with LanguageTool...")
+                        
+                        for result in evaluate_extracted_batch(batch, lang_evaluator, root_dir,
+                                                               args.min_words, args.min_letter_ratio):
+                            writer.writerow(result)
+                            stats.update(result)
+                            if stats.size % CSV_FLUSH_ROWS == 0:
+                                csvfile.flush()
+                finally:
+                    producer.join(timeout=1)
+                    if page_pool is not None:
+                        page_pool.shutdown()
+            else:
+                # All workers share one LanguageTool server (one JVM, dictionaries loaded once)
+                remote_server = args.remote_server
+                if remote_server is None:
+                    server = LanguageQualityEvaluator(args.language, use_cache=False, quiet=args.quiet)
+                    remote_server = server.server_url
+                
+                if not args.quiet:
+                    print(f"Using {workers} worker processes with LanguageTool server {remote_server}")
+                
+                with ProcessPoolExecutor(max_workers=workers, initializer=_worker_init,
+                                         initargs=(args.language, not args.no_cache, remote_server)) as executor:
+                    futures = [executor.submit(_worker_eval, (pdf_file, root_dir, args.min_words, args.min_letter_ratio))
+                               for pdf_file in pdf_files]
+                    
+                    for i, future in enumerate(as_completed(futures)):
+                        result = future.result()
+                        if not args.quiet:
+                            print(f"Processed {i+1}/{len(pdf_files)}: {result[1]}")
+                        writer.writerow(result)
+                        stats.update(result)
+                        if stats.size % CSV_FLUSH_ROWS == 0:
+                            csvfile.flush()
+        
+        if args.sort:
             # Sort by quality score (best first)
-            results.sort(key=lambda x: float(x[14]) if x[14] != "0" else 0, reverse=True)
-            writer.writerows(results)
+            sort_results_file(args.output)
         
         # Print statistics
-        print_statistics(results, args.quiet)
+        print_statistics(stats, args.quiet)
         
         if not args.quiet:
             print(f"\nResults saved to: {args.output}")
@@ -460,6 +1102,8 @@ def main():
         # Clean up LanguageTool
         if 'lang_evaluator' in locals():
             del lang_evaluator
+        if 'server' in locals():
+            del server
 
 if __name__ == "__main__":
     main()
\ No newline at end of file